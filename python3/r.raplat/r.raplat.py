@@ -523,75 +523,58 @@ mapset = grass.gisenv()['MAPSET']
 
 # check output table and map filenames
 import re
+import string
+
+_NAME_RE = re.compile(r'[A-Za-z][A-Za-z0-9_]*')  # output map and table names
+_CELLNAME_BAD_RE = re.compile(r'[^A-Za-z0-9_-]')  # any char not allowed in 'name' type columns (cellName)
+_QUOTED_RE = re.compile(r'".*?"')  # quoted text (CSV)
+_PROGRESS_RE = re.compile(rb' [ 0-9]{3}%[\b]{5}')  # GRASS "%" progress (like '  29%<BS><BS><BS><BS><BS>')
+
+# characters allowed in antenna type names (antennas-mapping table and radio cell/sector table)
+antTypeChars = string.ascii_letters + string.digits + ' ' + '-' + '/' + '.'
+_ANT_TYPE_CHARSET = frozenset(antTypeChars)
 
 outFilename = options['out_map']
-if re.match(r'[A-Za-z][A-Za-z0-9_]*\Z', outFilename) == None:
+if not _NAME_RE.fullmatch(outFilename):
     grass.fatal("Wrong output map filename '" + outFilename + "'\n" +
                 "allowed chars: 'A-Z', 'a-z', '0-9', and '_' (must start with a char)")
 
 dbFilename = options['out_table']
-if re.match(r'[A-Za-z][A-Za-z0-9_]*\Z', dbFilename) == None:
+if not _NAME_RE.fullmatch(dbFilename):
     grass.fatal("Wrong output table filename '" + dbFilename + "'\n" +
                 "allowed chars: 'A-Z', 'a-z', '0-9', and '_' (must start with a char)")
 
 
 # check numeric arguments values (grass parser does not perform this)
-intArgList = ['cellnum', 'dbperf', 'procnum']
-optIntArgList = []
-floatArgList = ['rx_ant_height', 'bandwidth']
-optFloatArgList = ['freq_ovr', 'radius_ovr', 'rx_threshold']
-for optKey in ( intArgList + optIntArgList + floatArgList + optFloatArgList):
+# (option key, conversion function, optional)
+_ARG_SPECS = [('cellnum', int, False), ('dbperf', int, False), ('procnum', int, False),
+              ('rx_ant_height', float, False), ('bandwidth', float, False),
+              ('freq_ovr', float, True), ('radius_ovr', float, True), ('rx_threshold', float, True)]
+for optKey, optConv, optOptional in _ARG_SPECS:
     optStr = options[optKey]
-    if optKey in ( optIntArgList + optFloatArgList):
-        if optStr == '':
-            continue
-    if optKey in ( intArgList + optIntArgList):
-        try:
-            int(optStr)
-        except:
+    if optOptional and optStr == '':
+        continue
+    try:
+        optConv(optStr)
+    except ValueError:
+        if optConv is int:
             grass.fatal('Non-integer value for integer parameter: ' + optKey + '=' + optStr )
-    else:
-        try:
-            float(optStr)
-        except:
+        else:
             grass.fatal('Non-numeric value for float parameter: ' + optKey + '=' + optStr )
 
 
 # ---- SET THE NUMBER OF PARALLEL PROCESSES
 # ---- used for parallel computations of model and sectors
-
-# detectCPU is from:
-#   http://www.artima.com/weblogs/viewpost.jsp?thread=230001
-#   Computing Thoughts
-#   Concurrency with Python, Twisted, and Flex
-#   by Bruce Eckel
-#   May 3, 2008
-
-def detectCPUs():
-    """
-    Detects the number of CPUs on a system. Cribbed from pp.
-    """
-    # Linux, Unix and MacOS:
-    if hasattr(os, "sysconf"):
-        if "SC_NPROCESSORS_ONLN" in os.sysconf_names:
-            # Linux & Unix:
-            ncpus = os.sysconf("SC_NPROCESSORS_ONLN")
-            if isinstance(ncpus, int) and ncpus > 0:
-                return ncpus
-        else: # OSX:
-            return int(os.popen2("sysctl -n hw.ncpu")[1].read())
-    # Windows:
-    if "NUMBER_OF_PROCESSORS" in os.environ:
-            ncpus = int(os.environ["NUMBER_OF_PROCESSORS"]);
-            if ncpus > 0:
-                return ncpus
-    return 1 # Default
-
-#----------------
+# (each model/sector computation is a separate GRASS module process started with its command line arguments,
+#  the tables built by this script (antMapTable, amDict, ...) are never passed to these processes)
 
 parNum = int(options['procnum'])
 if parNum < 0:
-    parNum = detectCPUs()
+    # CPUs available to this process (respects affinity, e.g. taskset or container CPU sets)
+    if hasattr(os, 'sched_getaffinity'):
+        parNum = len(os.sched_getaffinity(0))
+    else:
+        parNum = os.cpu_count() or 1
     grass.info('\nNumber of detected processors = ' + str(parNum))
 
 
@@ -602,42 +585,51 @@ grass.info('\nREADING AND CHECKING THE ANTENNAS-MAPPING CSV TABLE ...')
 import csv
 
 # get the name of the antenna map file from the parameter (or default)
-amPathname = options['antmap_file']
-# evaluate GISBASE enviroment variable
+# and evaluate enviroment variables (e.g. $GISBASE)
 gisBase = os.getenv('GISBASE')
-amPathname = amPathname.replace('$GISBASE',gisBase)
-# create full absolute path for inPathname
-amPathname = os.path.join(gisBase + '/etc/radio_coverage/antenna_diagrams', amPathname)
+amPathname = os.path.expandvars(options['antmap_file'])
+# create full absolute path for a relative amPathname (relative to the default antenna_diagrams directory)
+if not os.path.isabs(amPathname):
+    amPathname = os.path.join(gisBase, 'etc/radio_coverage/antenna_diagrams', amPathname)
 
 try:
-    csvFile = open(amPathname, 'r')
-except IOError as xxx_todo_changeme:
-    (errno, strerror) = xxx_todo_changeme.args
+    csvFile = open(amPathname, 'r', newline='', buffering=1<<20)  # large buffer - fewer read calls
+except IOError:
     grass.fatal("Cannot open Antennas-Mapping input file '" + amPathname + "'")
-    
-#standard type of CSV required (delimiter ',')
-csvReader = csv.reader( csvFile)
-
-antMapTable=[]
-for row in csvReader:
-    if row == []:  # skip empty lines
-        continue
-    if row[0][0] != '#':  # append line if not commented out
-        antMapTable.append(row)    
-csvFile.close()
-
-
-# ---- CHECK AND REMOVE THE HEADER (the first line) ----
 
 refAntMapTableHeader = ['antennaType', 'frequency', 'frequencyLower', 'frequencyUpper', 'EDT', 'MSIfilename', 'technology']
-antMapTableHeader = antMapTable[0]
-if antMapTableHeader != refAntMapTableHeader:
-    _msgStr = 'Error in Antennas-Mapping Table header:\n'
-    _msgStr += str(antMapTableHeader)
-    _msgStr += '\nShould be:\n'
-    _msgStr += str(refAntMapTableHeader)
-    grass.fatal(_msgStr)
-del antMapTable[0]
+
+# single pass through the file: skip empty and commented out lines, check and remove the header (the first line),
+# convert numeric columns (frequency, frequencyLower, frequencyUpper, EDT) once, so that the validation and
+# findAntennas() do not repeat the conversions
+# row: (antennaType, frequency, frequencyLower, frequencyUpper, EDT, MSIfilename, technology)
+with csvFile:
+    #standard type of CSV required (delimiter ',')
+    csvReader = csv.reader( csvFile, dialect='excel')
+    antMapRows = (row for row in csvReader if row != [] and row[0][:1] != '#')
+
+    # ---- CHECK AND REMOVE THE HEADER (the first line) ----
+    antMapTableHeader = next(antMapRows, [])
+    if antMapTableHeader != refAntMapTableHeader:
+        _msgStr = 'Error in Antennas-Mapping Table header:\n'
+        _msgStr += str(antMapTableHeader)
+        _msgStr += '\nShould be:\n'
+        _msgStr += str(refAntMapTableHeader)
+        grass.fatal(_msgStr)
+
+    antMapRows = list(antMapRows)
+
+for antMapTableRow in antMapRows:
+    if len(antMapTableRow) != len(refAntMapTableHeader):
+        grass.fatal('Wrong number of columns in Antennas-Mapping Table row:\n' + str( antMapTableRow))
+
+# convert the numeric columns column by column (map() instead of a float() call per value)
+if antMapRows != []:
+    [aTypeClmn, aFreqClmn, aFreqLowClmn, aFreqHighClmn, aTiltClmn, aMSIfnameClmn, aTechClmn] = zip(*antMapRows)
+    antMapTable = list(zip(aTypeClmn, map(float, aFreqClmn), map(float, aFreqLowClmn), map(float, aFreqHighClmn),
+                           map(float, aTiltClmn), aMSIfnameClmn, aTechClmn))
+else:
+    antMapTable = []
 
 
 # ---- CHECK COLUMN VALUES, BUILD .MSI FILES DICTIONARY (short filename -> full pathname) ----
@@ -654,60 +646,96 @@ del antMapTable[0]
 
 # make a list of all files in the antenna_diagrams subdirectories, check for duplicates, create dictionary (name -> fullpath)
 amDir = os.path.dirname(amPathname)  # the antenna_daigrams directory (location of the antennamap file)
-amFileList = []
-errf = False
-for rootName, dirList, fileList in os.walk(amDir):
-    for filename in fileList:
-        [fnBase, fnExt] = os.path.splitext(filename)
-        if fnExt.upper() == '.MSI':
-            if fnBase in [amFileListRow[0] for amFileListRow in amFileList]:
-                grass.error("Duplicate .MSI file found in the directory tree: '" + filename + "'")
-                errf = True
-            else:
-                amFileList.append([fnBase, os.path.join(rootName, filename)])
-amDict = dict(amFileList)  # create filenames dictionary
-if errf:
+def scan_msi_files(dirName):
+    """
+    Yield (filename, full pathname) for all .MSI files (any case) in the directory tree
+    (top-down, files of a directory before its subdirectories - the same order as os.walk)
+    """
+    subDirList = []
+    try:
+        dirEntries = os.scandir(dirName)
+    except OSError:
+        return  # directory can not be read - skip it (as os.walk does)
+    with dirEntries:
+        for entry in dirEntries:
+            if entry.is_dir(follow_symlinks=False):
+                subDirList.append(entry.path)
+            elif len(entry.name) > 4 and entry.name[-4:].upper() == '.MSI' and entry.is_file():
+                yield entry.name, entry.path
+    for subDir in subDirList:
+        yield from scan_msi_files(subDir)
+
+def build_msi_dict(dirName, maxDuplicates):
+    """
+    Build .MSI files dictionary (filename w/o extension -> full pathname) for the directory tree,
+    returns (dictionary, list of duplicate filenames); stops when more than maxDuplicates duplicates are found
+    """
+    msiDict = {}
+    dupList = []
+    for filename, fullPathname in scan_msi_files(dirName):
+        fnBase = filename[:-4]
+        if fnBase in msiDict:
+            dupList.append(filename)
+            if len(dupList) > maxDuplicates:
+                break
+        else:
+            msiDict[fnBase] = fullPathname
+    return msiDict, dupList
+
+maxDuplicates = 10
+amDict, amDupList = build_msi_dict(amDir, maxDuplicates)
+if amDupList != []:
+    _msgStr = 'Duplicate .MSI file(s) found in the directory tree'
+    if len(amDupList) > maxDuplicates:
+        _msgStr += ' (only the first ' + str(maxDuplicates) + ' listed)'
+    grass.error(_msgStr + ':\n' + '\n'.join(amDupList[:maxDuplicates]))
     sys.exit(1)
-grass.info('Number of .MSI files found: ' + str(len(amFileList)))
+grass.info('Number of .MSI files found: ' + str(len(amDict)))
 
 # Check column values
-import string
-errmsg = ''
-antTypeChars = string.ascii_letters + string.digits + ' ' + '-' + '/' + '.'
-for antMapTableRow in antMapTable:
-    [antType, antFreq, antFreqLow, antFreqHigh, antTilt, MSIfname, tech] = antMapTableRow
-    fAntFreq     = float(antFreq)
-    fAntFreqLow  = float(antFreqLow)
-    fAntFreqHigh = float(antFreqHigh)
-    fAntTilt     = float(antTilt)
-    for atchar in antType:
-        if not atchar in antTypeChars:
-            errmsg += 'Illegal caharacters in Antenna type, allowed: ' + antTypeChars + '\n'
-            break
+
+
+def _validate_antmap_row(antMapTableRow):
+    """ Check an antennas-mapping table row, returns an error string (the first error found) or None """
+    [antType, fAntFreq, fAntFreqLow, fAntFreqHigh, fAntTilt, MSIfname, tech] = antMapTableRow
+    if not _ANT_TYPE_CHARSET.issuperset(antType):
+        return 'Illegal caharacters in Antenna type, allowed: ' + antTypeChars
     if fAntFreqLow > fAntFreqHigh:
-        errmsg += 'Frequency error: Lower > Upper\n'
+        return 'Frequency error: Lower > Upper'
     if fAntFreq < fAntFreqLow:
-        errmsg += 'Frequency error: < Lower\n'
+        return 'Frequency error: < Lower'
     if fAntFreq > fAntFreqHigh:
-        errmsg += 'Frequency error: > Upper\n'
+        return 'Frequency error: > Upper'
     if fAntTilt < 0 or fAntTilt > 90:
-        errmsg += 'EDT of of range, allowed: 0..90\n'
-    if not MSIfname in list(amDict.keys()):
-        errmsg += "MSI file not found: '" + MSIfname + "'\n"
-    if errmsg != '':
-        break
-if errmsg != '':
-    grass.fatal(errmsg + ' in row:\n' + str( antMapTableRow))
+        return 'EDT of of range, allowed: 0..90'
+    if MSIfname not in amDict:
+        return "MSI file not found: '" + MSIfname + "'"
+    return None
+
+
+for antMapTableRow in antMapTable:
+    errmsg = _validate_antmap_row(antMapTableRow)
+    if errmsg is not None:
+        grass.fatal(errmsg + '\n in row:\n' + str( antMapTableRow))
+
 
+# index the antennas-mapping table by (antennaType, EDT) -> list of (frequency, frequencyLower, frequencyUpper, MSIfilename)
+#   (table order is preserved within each list)
+import collections
+_antIndex = collections.defaultdict(list)
+for (aType, aFreq, aFreqLow, aFreqHigh, aTilt, aMSIfname, aTech) in antMapTable:
+    _antIndex[(aType, aTilt)].append( (aFreq, aFreqLow, aFreqHigh, aMSIfname) )
 
-def findAntennas( aMapTable, rType, rFreqNum, rTiltNum):
+
+# findAntennas() results, memoized per (antType, freq, antElecTilt) - many sectors share them
+_antCache = {}
+
+def findAntennas( antIndex, rType, rFreqNum, rTiltNum):
     """ Find suitable antennas (returns a list) """
     antennas = []
-    for [aType, aFreq, aFreqLow, aFreqHigh, aTilt, aMSIfname, aTech] in aMapTable:
-        if (rType == aType and
-            rFreqNum >= float(aFreqLow) and rFreqNum <= float(aFreqHigh) and
-            rTiltNum == float(aTilt)):
-            antennas.append( (aMSIfname, abs(rFreqNum - float(aFreq))) )
+    for (aFreq, aFreqLow, aFreqHigh, aMSIfname) in antIndex.get( (rType, rTiltNum), ()):
+        if rFreqNum >= aFreqLow and rFreqNum <= aFreqHigh:
+            antennas.append( (aMSIfname, abs(rFreqNum - aFreq)) )
     if len(antennas) == 0:
         return []
     antennas.sort( key=lambda row: row[1])  # sort by frequency difference (nominal freq.)
@@ -723,42 +751,46 @@ grass.info('\nREADING AND CHECKING THE RADIO SECTOR CSV TABLE ...')
 refCellTableHeader = []
 for clmnlist in cellTableDescrib:
     refCellTableHeader.append(clmnlist[0])
+# header name -> column index, and the set of header names (for fast lookups)
+_headerIdx = {name: ix for ix, name in enumerate(refCellTableHeader)}
+_headerSet = frozenset(refCellTableHeader)
+# column indices of the model parameters P1, P2, ... (in this order, up to the first missing Pn)
+_pColIdx = []
+while 'P' + str(len(_pColIdx) + 1) in _headerIdx:
+    _pColIdx.append(_headerIdx['P' + str(len(_pColIdx) + 1)])
 
 #open the radio sector CSV file
 try:
-    csvFile = open(options['csv_file'], 'r')
+    csvFile = open(options['csv_file'], 'r', newline='', buffering=1<<20)  # large buffer - fewer read calls
 except IOError:
     grass.fatal('Cannot open Radio cell/sector input file')
-    
-#determine the type of CSV - standard (delimiter ',') or MS Euro (delimiter ';')
-hline1 = csvFile.readline()
-hline1 = re.sub(r'".*?"', '', hline1)  #remove quoted text
-hStd = hline1.count(',') > 0
-hMSE = hline1.count(';') > 0
-if not hStd and not hMSE:
-    grass.fatal('CSV file first line (header) error: no separator (commas or semicolons) found')
-if hStd and hMSE:
-    grass.fatal('CSV file first line (header) error: separator ambiguity - commas and semicolons found')
-if hStd:
-    grass.info('Standard CSV file format detected')
-    csvReader = csv.reader( csvFile)
-else:
-    grass.info('MS Euro CSV file format detected')
-##    csvReader = csv.reader( csvFile, delimiter=';', quoting=csv.QUOTE_NONE)
-    csvReader = csv.reader( csvFile, delimiter=';')
-csvFile.seek(0)
-
-cellTable=[]
-for row in csvReader:
-    if row == []:  # skip empty lines
-        continue
-    if row[0][0] != '#':  # append line if not commented out
-        for ix in range( len(row), len(refCellTableHeader)):
-            row.append('')   #add dummy items to the row until reference header length (number of columns) is reached
-        cellTable.append(row)    
 
-csvFile.close()
+import itertools
+
+with csvFile:
+    #determine the type of CSV - standard (delimiter ',') or MS Euro (delimiter ';')
+    hline1 = csvFile.readline()
+    hline1Unquoted = _QUOTED_RE.sub('', hline1) if '"' in hline1 else hline1  #remove quoted text
+    hStd = ',' in hline1Unquoted
+    hMSE = ';' in hline1Unquoted
+    if not hStd and not hMSE:
+        grass.fatal('CSV file first line (header) error: no separator (commas or semicolons) found')
+    if hStd and hMSE:
+        grass.fatal('CSV file first line (header) error: separator ambiguity - commas and semicolons found')
+    # the first line is fed back to the reader (the file is read only once, no seek)
+    csvLines = itertools.chain([hline1], csvFile)
+    if hStd:
+        grass.info('Standard CSV file format detected')
+        csvReader = csv.reader( csvLines)
+    else:
+        grass.info('MS Euro CSV file format detected')
+##        csvReader = csv.reader( csvLines, delimiter=';', quoting=csv.QUOTE_NONE)
+        csvReader = csv.reader( csvLines, delimiter=';')
 
+    # skip empty and commented out lines,
+    # add dummy items to each row until reference header length (number of columns) is reached
+    rowPad = [''] * len(refCellTableHeader)
+    cellTable = [row + rowPad[len(row):] for row in csvReader if row != [] and row[0][:1] != '#']
 
 # ---- CHECK AND REMOVE THE HEADER (the first line) ----
 
@@ -794,188 +826,185 @@ if modelOvrStr != '':
     for ix,paramValueStr in enumerate(modelOvrList[1:]):
         overrideList.append( ('P' + str(ix+1), paramValueStr))
     ix += 2
-    while 'P' + str(ix) in refCellTableHeader:  # clear the rest of Pn's
+    while 'P' + str(ix) in _headerSet:  # clear the rest of Pn's
         overrideList.append( ('P' + str(ix), ''))
         ix += 1
 
-for ovrItem in overrideList:
-    if ovrItem[0] in refCellTableHeader:
-        clmnix = refCellTableHeader.index(ovrItem[0])
-        for rowix,row in enumerate(cellTable):  # step through cellTable lines
-                cellTable[rowix][clmnix]=ovrItem[1]  # replace column
+# column index -> override value
+ovrByIdx = {}
+for ovrKey, ovrValue in overrideList:
+    if ovrKey in _headerIdx:
+        ovrByIdx[_headerIdx[ovrKey]] = ovrValue
     else:
         print('??? INTERNAL ERROR (overrideList) - override item not in refCellTableHeader')
         sys.exit(1)
 
+if ovrByIdx:
+    for row in cellTable:  # step through cellTable lines
+        for clmnix, ovrValue in ovrByIdx.items():
+            row[clmnix] = ovrValue  # replace column
+
 
-# ---- CHECK 'cellName' AND 'antID' COLUMNS FOR DUPLICATES (warning and error respectivelly)
+# ---- CHECK 'antID' COLUMN FOR DUPLICATES (error)
+# ('cellName' duplicates are not checked - no warnings needed for duplicate names (it is normal))
 
 for tcix, clmnDescr in enumerate(cellTableDescrib):  # tcix: cellTable column index
-    if clmnDescr[1] in ['id','name']:
-        dupCheckList = []
+    if clmnDescr[1] == 'id':
+        dupCheckSet = set()
         for cellTableLine in cellTable:
             cellTableField = cellTableLine[tcix]
-            if cellTableField in dupCheckList:
-                _msgStr = " Duplicated '" + clmnDescr[0] + "': " + cellTableField
-                if clmnDescr[1] == 'id':
-                    grass.fatal(_msgStr)
-                else:
-                    pass  # no warnings needed for duplicate names (it is normal)
-##                    grass.warning(_msgStr)
-            else:
-                dupCheckList.append(cellTableField)
-            
+            if cellTableField in dupCheckSet:
+                grass.fatal(" Duplicated '" + clmnDescr[0] + "': " + cellTableField)
+            dupCheckSet.add(cellTableField)
+
 
 # ---- CHECK PARAMETERS (each table row) ----
 
 # checking the input (CSV) table according to the rules given by cellTableDescrib
-# a bit tricky and hard-to-explain procedural part of code follows :(
-err = False  # becomes True if one or more parameter errors are found in a a table row
-for cellTableLine in cellTable:
-    vix = 1  # variant index (=1 unless multi-variant column definitions are used)
-    for tcix, clmnDescr in enumerate(cellTableDescrib):  # tcix: cellTable column index
-        # find the (chosen variant of the) parameter description list for the current parameter (table column)
-        ibegin = 1  # this will be the beginning of the (chosen variant of the) parameter description list
-        iend = len(clmnDescr)  # this will be the end of the (chosen variant of the) parameter description list
-        n = 0  # a local variant counter (for a column)
-        for i in range(1, iend):
-            if isinstance(clmnDescr[i], str):
-                n += 1
-                if n == vix:
-                    ibegin = i
-                    break
-        for i in range( ibegin + 1, iend):
-            if not isinstance( clmnDescr[i], list):
-                iend = i
-                break
-
-        # extract the (chosen variant of the) parameter description list for the current parameter
-        clmnDescSublist = clmnDescr[ibegin:iend]
+# the rules are "compiled" once into check functions, one list of check functions (variants) per table column;
+# a check function takes a table row and returns (error string or '', variant index factor)
 
+def compile_column_check(tcix, clmnDescSublist):
+    """
+    Build a check function for the (chosen variant of the) parameter description list of table column tcix
+    """
+    # process (check correctness of) the parameter description according to cellTableDescrib
+    if clmnDescSublist == []:
+        print('??? INTERNAL ERROR (cellTableDescrib) - empty (or too short) column description')
+        sys.exit(1)
 
-        # process (check correctness of) parameters according to cellTableDescrib
-        if clmnDescSublist == []:
-            print('??? INTERNAL ERROR (cellTableDescrib) - empty (or too short) column description')
+    # unchecked type
+    elif clmnDescSublist[0] == '-':
+        if len(clmnDescSublist) != 1:
+            print("??? INTERNAL ERROR (cellTableDescrib) - type '-' should have no additional parameters")
             sys.exit(1)
 
-        # unchecked type
-        elif clmnDescSublist[0] == '-':
-            if len(clmnDescSublist) != 1:
-                print("??? INTERNAL ERROR (cellTableDescrib) - type '-' should have no additional parameters")
-                sys.exit(1)
+        def check(cellTableLine):
+            return '', 1
 
-        # numeric types (integer, float) - check against min and max allowed values
-        elif clmnDescSublist[0] in ['id', 'i', 'f']:
-            if len(clmnDescSublist) != 2:
-                print("??? INTERNAL ERROR (cellTableDescrib) - type 'i', 'id' or 'f' should have one additonal parameter (list)")
+    # numeric types (integer, float) - check against min and max allowed values
+    elif clmnDescSublist[0] in ['id', 'i', 'f']:
+        if len(clmnDescSublist) != 2:
+            print("??? INTERNAL ERROR (cellTableDescrib) - type 'i', 'id' or 'f' should have one additonal parameter (list)")
+            sys.exit(1)
+        nerr = (len(clmnDescSublist[1]) != 2)
+        if not nerr:
+            nummin = clmnDescSublist[1][0]
+            nummax = clmnDescSublist[1][1]
+        if clmnDescSublist[0] == 'f':
+            nerr = nerr or not isinstance(nummin, float) or not isinstance(nummax, float)
+            if nerr:
+                print('??? INTERNAL ERROR (cellTableDescrib) - invalid floating number range definition ( = ', clmnDescSublist[1], ')')
                 sys.exit(1)
-            nerr = (len(clmnDescSublist[1]) != 2)
-            if not nerr:
-                nummin = clmnDescSublist[1][0]
-                nummax = clmnDescSublist[1][1]
-            if clmnDescSublist[0] == 'f':
-                nerr = nerr or not isinstance(nummin, float) or not isinstance(nummax, float)
-                if nerr:
-                    print('??? INTERNAL ERROR (cellTableDescrib) - invalid floating number range definition ( = ', clmnDescSublist[1], ')')
-                    sys.exit(1)
-            else:
-                nerr = nerr or not isinstance(nummin, int) or not isinstance(nummax, int)
-                if nerr:
-                    print('??? INTERNAL ERROR (cellTableDescrib) - invalid integer number range definition ( = ', clmnDescSublist[1], ')')
-                    sys.exit(1)
+            numConv = float
+            numTypeStr = 'a floating point number'
+        else:
+            nerr = nerr or not isinstance(nummin, int) or not isinstance(nummax, int)
+            if nerr:
+                print('??? INTERNAL ERROR (cellTableDescrib) - invalid integer number range definition ( = ', clmnDescSublist[1], ')')
+                sys.exit(1)
+            numConv = int
+            numTypeStr = 'an integer number'
+        fRange = nummin < nummax  # range [0, 0] (or similar) - value not checked
 
-            # now process the value from the CSV table
-            # but first change any (decimal) comma do (decimal) point
+        def check(cellTableLine):
+            # first change any (decimal) comma do (decimal) point
             #   (and store it back also to the original table)
-            cellTableLine[tcix] = cellTableLine[tcix].replace(',', '.')
-            _msgstr = 'Error in input table:\n' + ', '.join(cellTableLine) + '\n'
             try:
-                if clmnDescSublist[0] == 'f':
-                    num = float( cellTableLine[tcix])
-                else:
-                    num = int( cellTableLine[tcix])
+                cellTableLine[tcix] = cellTableLine[tcix].replace(',', '.')
+                num = numConv( cellTableLine[tcix])
             except ValueError:
-                _msgstr += 'Column ' + str(tcix+1) + ' (=' + str(cellTableLine[tcix]) + ') should be '
-                if clmnDescSublist[0] == 'f':
-                    _msgstr += 'a floating point number'
-                else:
-                    _msgstr += 'an integer number'
-                grass.error(_msgstr)
-                err = True
+                return 'Column ' + str(tcix+1) + ' (=' + str(cellTableLine[tcix]) + ') should be ' + numTypeStr, 1
             except IndexError:
-                _msgstr +=  'Line too short - column ' + str(tcix+1) + ' missing (number expected)'
-                grass.error(_msgstr)
-                err = True
-            if nummin < nummax:
-                if (num < nummin) or (num > nummax):
-                    _msgstr += ('Number in column ' + str(tcix+1) + ' (=' + str(cellTableLine[tcix]) + ') is out of range ' +
-                                str(nummin) + '..' + str(nummax))
-                    grass.error(_msgstr)
-                    err = True
-            
-        # string type - check against allowed list of string - possibly more than one list (variants)
-        elif clmnDescSublist[0] == 's':
-            if len(clmnDescSublist) < 2:
-                print("??? INTERNAL ERROR - type 's' should have one or more additonal parameter(s) (list(s))")
-                sys.exit(1)
-            ixstr = 0
-            for strlst in clmnDescSublist[1:]:
-                ixstr += 1
-                if not isinstance(strlst, list):
-                    print("??? INTERNAL ERROR (cellTableDescrib) - 's'  should be followed by lists(s) of strings")
-                    sys.exit(1)
-                # now process the value from the CSV table
-                _msgstr = 'Error in input table:\n' + ', '.join(cellTableLine) + '\n'
-                try:
-                    if cellTableLine[tcix] in strlst:
-                        vix *= ixstr  # matching string found - OK
-                        break
-                except IndexError:
-                    _msgstr += 'Line too short - column ' + str(tcix+1) + ' missing (string expected)'
-                    grass.error(_msgstr)
-                    err = True
-                    break
-            else:
-                _msgstr = 'Error in input table:\n' + ', '.join(cellTableLine) + '\n'
-                _msgstr += 'String in column ' + str(tcix+1) + ' (=' + str(cellTableLine[tcix]) + ') is not allowed. Allowed: '
-                fullstrlst = []
-                for strlst in clmnDescSublist[1:]:
-                    fullstrlst.extend(strlst)
-                _msgstr += ', '.join(fullstrlst)
-                grass.error(_msgstr)
-                err = True
-
-        # "name" string type - the following characters are allowed:
-        #     'A..Z', 'a..z', '0..9', '_', '-'
-        elif clmnDescSublist[0] == 'name':
-            if len(clmnDescSublist) != 1:
-                print("??? INTERNAL ERROR cellTableDescrib - type 'name' should have no additonal parameter (list)")
-                sys.exit(1)
-            if re.search(r'[^A-Za-z0-9_-]', cellTableLine[tcix]):
-                _msgstr = 'Error in input table:\n' + ', '.join(cellTableLine) + '\n'
-                _msgstr += 'Wrong string in column ' + str(tcix+1) + ' (=' + str(cellTableLine[tcix]) + ').'
-                _msgstr += " Allowed chars: 'A..Z', 'a..z', '0..9', '_', '-'"
-                grass.error(_msgstr)
-                err = True
-
-        # "antype" string type - the following characters are allowed:
-        #     'A..Z', 'a..z', '0..9', '_', '-'
-        elif clmnDescSublist[0] == 'antype':
-            if len(clmnDescSublist) != 1:
-                print("??? INTERNAL ERROR cellTableDescrib - type 'antype' should have no additonal parameter (list)")
+                return 'Line too short - column ' + str(tcix+1) + ' missing (number expected)', 1
+            if fRange and ((num < nummin) or (num > nummax)):
+                return ('Number in column ' + str(tcix+1) + ' (=' + str(cellTableLine[tcix]) + ') is out of range ' +
+                        str(nummin) + '..' + str(nummax)), 1
+            return '', 1
+
+    # string type - check against allowed list of string - possibly more than one list (variants)
+    elif clmnDescSublist[0] == 's':
+        if len(clmnDescSublist) < 2:
+            print("??? INTERNAL ERROR - type 's' should have one or more additonal parameter(s) (list(s))")
+            sys.exit(1)
+        strLists = clmnDescSublist[1:]
+        fullstrlst = []
+        for strlst in strLists:
+            if not isinstance(strlst, list):
+                print("??? INTERNAL ERROR (cellTableDescrib) - 's'  should be followed by lists(s) of strings")
                 sys.exit(1)
-            for atchar in cellTableLine[tcix]:
-                if not atchar in antTypeChars:
-                    _msgstr = 'Error in input table:\n' + ', '.join(cellTableLine) + '\n'
-                    _msgstr += 'Wrong string in column ' + str(tcix+1) + ' (=' + str(cellTableLine[tcix]) + ').'
-                    _msgstr += ' Allowed chars: ' + antTypeChars
-                    grass.error(_msgstr)
-                    err = True
+            fullstrlst.extend(strlst)
+        allowedStr = ', '.join(fullstrlst)
 
-        else:
-            print('??? INTERNAL ERROR - invalid type definition in cellTableDescrib ( =', clmnDescSublist[0], ')') 
+        def check(cellTableLine):
+            try:
+                value = cellTableLine[tcix]
+            except IndexError:
+                return 'Line too short - column ' + str(tcix+1) + ' missing (string expected)', 1
+            for ixstr, strlst in enumerate(strLists, 1):
+                if value in strlst:
+                    return '', ixstr  # matching string found - OK
+            return 'String in column ' + str(tcix+1) + ' (=' + str(value) + ') is not allowed. Allowed: ' + allowedStr, 1
+
+    # "name" string type - the following characters are allowed:
+    #     'A..Z', 'a..z', '0..9', '_', '-'
+    elif clmnDescSublist[0] == 'name':
+        if len(clmnDescSublist) != 1:
+            print("??? INTERNAL ERROR cellTableDescrib - type 'name' should have no additonal parameter (list)")
+            sys.exit(1)
+
+        def check(cellTableLine):
+            if _CELLNAME_BAD_RE.search(cellTableLine[tcix]):
+                return ('Wrong string in column ' + str(tcix+1) + ' (=' + str(cellTableLine[tcix]) + ').' +
+                        " Allowed chars: 'A..Z', 'a..z', '0..9', '_', '-'"), 1
+            return '', 1
+
+    # "antype" string type - the following characters are allowed:
+    #     'A..Z', 'a..z', '0..9', ' ', '-', '/', '.'
+    elif clmnDescSublist[0] == 'antype':
+        if len(clmnDescSublist) != 1:
+            print("??? INTERNAL ERROR cellTableDescrib - type 'antype' should have no additonal parameter (list)")
             sys.exit(1)
 
+        def check(cellTableLine):
+            if not _ANT_TYPE_CHARSET.issuperset(cellTableLine[tcix]):
+                return ('Wrong string in column ' + str(tcix+1) + ' (=' + str(cellTableLine[tcix]) + ').' +
+                        ' Allowed chars: ' + antTypeChars), 1
+            return '', 1
+
+    else:
+        print('??? INTERNAL ERROR - invalid type definition in cellTableDescrib ( =', clmnDescSublist[0], ')') 
+        sys.exit(1)
+
+    return check
+
+
+# split each column description into variants (type string followed by its parameter lists)
+# and compile a check function for each of them
+_cellValidators = []
+for tcix, clmnDescr in enumerate(cellTableDescrib):  # tcix: cellTable column index
+    variantChecks = []
+    ibegin = 1
+    for i in range(2, len(clmnDescr) + 1):
+        if i == len(clmnDescr) or isinstance(clmnDescr[i], str):
+            variantChecks.append(compile_column_check(tcix, clmnDescr[ibegin:i]))
+            ibegin = i
+    if variantChecks == []:
+        variantChecks.append(compile_column_check(tcix, []))
+    _cellValidators.append(variantChecks)
+
+err = False  # becomes True if one or more parameter errors are found in a a table row
+for cellTableLine in cellTable:
+    vix = 1  # variant index (=1 unless multi-variant column definitions are used)
+    for variantChecks in _cellValidators:
+        # the chosen variant (the first one if there are less variants than vix)
+        check = variantChecks[vix-1] if vix <= len(variantChecks) else variantChecks[0]
+        errStr, vixFactor = check(cellTableLine)
+        vix *= vixFactor
+        if errStr != '':
+            grass.error('Error in input table:\n' + ', '.join(cellTableLine) + '\n' + errStr)
+            err = True
+
 if err:
     grass.fatal('Exiting - error(s) found in input table parameters')
 
@@ -1054,21 +1083,18 @@ def set_region(regDict):
         sys.exit(1)
 
 
-def init_getCSVparam(keyList, paramList):
+def gCSVp(row, key, *args):
     """
-    Retrieve parameter value (as string) by its header name (string) from the input (CSV) table
+    Retrieve parameter value (as string) by its header name (string) from a row of the input (CSV) table
     """
-    def getCSVparam(key, *args):
-        try:
-            retstr = paramList[refCellTableHeader.index(key)]
-        except (ValueError, IndexError):
-            if len(args) == 1:
-                if args[0] == 'IGNORE_ERROR':
-                    return ''
-            print('??? INTERNAL ERROR - unknown key string (parameter name) (=', key, ') while building commands')
-            sys.exit(1)
-        return retstr
-    return getCSVparam
+    try:
+        return row[_headerIdx[key]]
+    except (KeyError, IndexError):
+        if len(args) == 1:
+            if args[0] == 'IGNORE_ERROR':
+                return ''
+        print('??? INTERNAL ERROR - unknown key string (parameter name) (=', key, ') while building commands')
+        sys.exit(1)
 
 
 def is_number(s):
@@ -1089,6 +1115,9 @@ atexit.register(set_region, regionOld)
 #demFilename = 'dem_ljutomer_25@PERMANENT'
 demFilename = options['dem_map']
 
+_VALID_REGION_KEYS = frozenset(['region', 'raster', 'n', 'e', 's', 'w', 'res'])
+_NUMERIC_REGION_KEYS = frozenset(['n', 'e', 's', 'w', 'res'])
+
 # create a new region as defined by the region parameters (computation region), and store it
 regionStr = options['region']
 regionStr = regionStr.replace(':', '=').replace(',', ' ')
@@ -1100,12 +1129,13 @@ else:
     keyValList = regionStr.split()
     regionCmd = ['g.region']
     for keyVal in keyValList:
-        if len(keyVal.split('=')) != 2:
+        parts = keyVal.split('=')
+        if len(parts) != 2:
             grass.fatal('Wrong region parameter definition: ' + keyVal)
-        [key, val] = keyVal.split('=')
-        if key not in ['region', 'raster', 'n', 'e', 's', 'w', 'res']:
+        [key, val] = parts
+        if key not in _VALID_REGION_KEYS:
             grass.fatal('Unknown region parameter: ' + keyVal)
-        if key in ['n', 'e', 's', 'w', 'res']:
+        if key in _NUMERIC_REGION_KEYS:
             # region is defined numerically
             if not is_number(val):
                 grass.fatal('Not a valid parameter value (should be a number): ' + keyVal)
@@ -1118,21 +1148,15 @@ else:
 
 import math
 
-def refineRegCoord(coord, res, mode):
-    if not mode in ['+', '-']:
-        print("??? INTERNAL ERROR - refineRegCoord mode error (should be '+' or '-')")
-
+def refineRegCoord(coord, res, mode, _ceil=math.ceil, _floor=math.floor):
+    half = res * 0.5
     if mode == '+':           # for lower border (W and S)
-        x = coord + res/2.0     # x = pixel center (was outer pixel edge (= region border))
-        x = math.ceil( x/res) * res  # rounded inwards
-        x = x - res/2.0         # back to pixel outer edge
-
-    else:                      # for higher border (N and E)
-        x = coord - res/2.0      # x = pixel center (was outer pixel edge (= region border))
-        x = math.floor( x/res) * res  # rounded inwards
-        x = x + res/2.0          # back to pixel outer edge
-
-    return x
+        # pixel center (was outer pixel edge (= region border)), rounded inwards, back to pixel outer edge
+        return _ceil((coord + half) / res) * res - half
+    elif mode == '-':          # for higher border (N and E)
+        return _floor((coord - half) / res) * res + half
+    else:
+        print("??? INTERNAL ERROR - refineRegCoord mode error (should be '+' or '-')")
 
         
 regionNotRefined = grass.region()
@@ -1156,28 +1180,55 @@ set_region(regionOld)
 # ---- FROM cellTable KEEP ONLY THE CELLS HAVING EFFECT INSIDE THE COMPUTATION REGION ----
 # ---- and define the extended computation region (encompasing all the remaining cells)
 
-cellTableReduced = []
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+eastIx = _headerIdx['antEast']
+northIx = _headerIdx['antNorth']
+radiusIx = _headerIdx['radius']
+if np is not None and cellTable != []:
+    # all cells at once
+    cellEast = np.array([int(row[eastIx]) for row in cellTable], dtype=np.int64)
+    cellNorth = np.array([int(row[northIx]) for row in cellTable], dtype=np.int64)
+    cellRadius = (1000.0 * np.array([float(row[radiusIx]) for row in cellTable])).astype(np.int64)
+    inMask = ((cellEast  >= wCompute - cellRadius) &
+              (cellEast  <= eCompute + cellRadius) &
+              (cellNorth <= nCompute + cellRadius) &
+              (cellNorth >= sCompute - cellRadius))
+    cellTable = [cellTable[ix] for ix in np.flatnonzero(inMask)]
+    cellEastList = cellEast[inMask].tolist()
+    cellNorthList = cellNorth[inMask].tolist()
+else:
+    cellTableReduced = []
+    cellEastList = []
+    cellNorthList = []
+    for row in cellTable:
+        cellRadius = int (1000.0 * float(row[radiusIx]))
+        cellEast = int(row[eastIx])
+        cellNorth = int(row[northIx])
+        if (cellEast  < wCompute - cellRadius or
+            cellEast  > eCompute + cellRadius or
+            cellNorth > nCompute + cellRadius or
+            cellNorth < sCompute - cellRadius):
+            pass
+        else:
+            cellTableReduced.append(row)
+            cellEastList.append(cellEast)
+            cellNorthList.append(cellNorth)
+    cellTable = cellTableReduced
+
+# the extended region is defined by the outermost remaining cells (if outside the computation region)
 wExtended = wCompute
 eExtended = eCompute
 nExtended = nCompute
 sExtended = sCompute
-for row in cellTable:
-    gCSVp = init_getCSVparam(refCellTableHeader, row)
-    cellRadius = int (1000.0 * float(gCSVp('radius')))
-    cellEast = int(gCSVp('antEast'))
-    cellNorth = int(gCSVp('antNorth'))
-    if (cellEast  < wCompute - cellRadius or
-        cellEast  > eCompute + cellRadius or
-        cellNorth > nCompute + cellRadius or
-        cellNorth < sCompute - cellRadius):
-        pass
-    else:
-        cellTableReduced.append(row)
-        if cellEast  < wExtended: wExtended = refineRegCoord(cellEast, res, '-')
-        if cellEast  > eExtended: eExtended = refineRegCoord(cellEast, res, '+')
-        if cellNorth > nExtended: nExtended = refineRegCoord(cellNorth, res, '+')
-        if cellNorth < sExtended: sExtended = refineRegCoord(cellNorth, res, '-')
-cellTable = cellTableReduced
+if cellTable != []:
+    if min(cellEastList)  < wExtended: wExtended = refineRegCoord(min(cellEastList), res, '-')
+    if max(cellEastList)  > eExtended: eExtended = refineRegCoord(max(cellEastList), res, '+')
+    if max(cellNorthList) > nExtended: nExtended = refineRegCoord(max(cellNorthList), res, '+')
+    if min(cellNorthList) < sExtended: sExtended = refineRegCoord(min(cellNorthList), res, '-')
 
 #define the extended computation region
 regionCmd = ['g.region', 'w=' + str(wExtended), 'e=' + str(eExtended),
@@ -1192,19 +1243,26 @@ set_region(regionOld)
 
 #testRegionList = [regionExtCompute, regionCompute, regionOld]
 testRegionList = [regionExtCompute]
+whatChunkLen = 1000  # max number of coordinate pairs per r.what call (command line length limit)
 for testRegion in testRegionList:
     set_region(testRegion)
+    # query DEM heights for all transmitter locations with as few r.what calls as possible
+    heightStrList = []
+    for ix in range(0, len(cellTable), whatChunkLen):
+        coordStr = ','.join(row[eastIx] + ',' + row[northIx]
+                            for row in cellTable[ix:ix+whatChunkLen])
+        whatAnsw = grass.read_command('r.what', map = demFilename, coordinates = coordStr)
+        # height is the last field of an r.what output line, e.g. '590000|151985||212' -> '212'
+        heightStrList.extend(line.rsplit('|', 1)[-1] for line in whatAnsw.splitlines() if line != '')
+    if len(heightStrList) != len(cellTable):
+        grass.fatal("Problem with DEM - r.what could not establish transmitters' heights")
     cellTableReduced = []
-    for row in cellTable:
-        gCSVp = init_getCSVparam(refCellTableHeader, row)
-        cellEastNorthStr = gCSVp('antEast') + ',' + gCSVp('antNorth')
-        whatAnsw = grass.read_command('r.what', map = demFilename, coordinates = cellEastNorthStr)
-        # re.sub (below) returns height from r.what output, e.g. '590000|151985||212' -> '212'
-        heightStr = re.sub(r'.*?\|.*?\|.*?\|', '', whatAnsw)
+    for row, heightStr in zip(cellTable, heightStrList):
+        cellEastNorthStr = gCSVp(row, 'antEast') + ',' + gCSVp(row, 'antNorth')
         if len(heightStr) == 0:
             grass.fatal("Problem with DEM - r.what could not establish transmitter's height")
         if heightStr[0] == '*':
-            grassMsg = ('Cell ' + gCSVp('cellName') + '-' + gCSVp('antID') +
+            grassMsg = ('Cell ' + gCSVp(row, 'cellName') + '-' + gCSVp(row, 'antID') +
                         ' removed from simulation ' + 
                         '(transmitter location ' + cellEastNorthStr + ' not defined in DEM)')
             if testRegion == regionExtCompute: grassMsg += ' (regionExtCompute)'
@@ -1218,14 +1276,15 @@ set_region(regionOld)
 
 
 
-# ---- PREPARE GRASS_GIS MODEL PROCESSING (hata, ...) ----
+# ---- PREPARE GRASS_GIS MODEL (hata, ...) AND SECTOR PROCESSING ----
 
 grass.info('\nGETTING THE LIST OF EXISTING MODEL AND SECTOR FILES\n' +
              'FROM PREVIOUS SIMULATION RUNS IN THE CURRENT MAPSET...')
 
 # get the list of existing files in current (users's) mapset
 p = grass.pipe_command("g.list", type="raster", mapset=mapset)
-existingFilesList = p.communicate()[0].splitlines()
+existingFilesList = p.communicate()[0].decode().splitlines()
+existingFilesSet = set(existingFilesList)  # for fast membership tests
 
 
 cmFilename = options['clutter_map']
@@ -1237,100 +1296,118 @@ rxAntHeightStr = options['rx_ant_height']
 float( rxAntHeightStr)
 
 requiredModSecFilesList=[]
+requiredModSecFilesSet=set()  # the same as requiredModSecFilesList, for fast membership tests
 
 modelFilenameList=[]
+modelFilenameSet=set()
 modelCmdList=[]
 
+sectorFilenameList=[]
+sectorFilenameSet=set()
+sectorCmdList=[]
+maxPowerSecList=[]
 
-def param_vals_str(sep):
-    pvstr = ''
-    ix = 1
-    while True:
-        pkey = 'P' + str(ix)
-        if not pkey in refCellTableHeader:
-            break
-        pval = gCSVp(pkey,'IGNORE_ERROR')
+
+def grass_cmd(cmdName, parts):
+    """
+    GRASS command argument list: [cmdName, 'key1=val1', 'key2=val2', ..., '--overwrite'] (parts: a list of (key, val))
+    """
+    return [cmdName] + [key + '=' + val for (key, val) in parts] + ['--overwrite']
+
+
+def param_vals(row):
+    """
+    Model parameters (P1, P2, ...) of a row, up to the first empty one (a list of strings)
+    """
+    pvals = []
+    for clmnix in _pColIdx:
+        pval = row[clmnix]
         if  pval == '':
             break
-        else:
-            pvstr += sep + pval
-        ix += 1
-    return pvstr
+        pvals.append(pval)
+    return pvals
 
 
+# a single pass through the table: model and sector (and MaxPower) data for each row
 for row in cellTable:
-    gCSVp = init_getCSVparam(refCellTableHeader, row)
-    modelName = gCSVp('model')
-    modelFilename = ('_' + modelName + param_vals_str('_') + '_' +
-                     gCSVp('antEast') + '_' + gCSVp('antNorth') + '_' + gCSVp('antHeightAG') + '_' + 
-                     gCSVp('radius') + '_' + gCSVp('freq'))
-    if not modelFilename in requiredModSecFilesList:
+    # frequently used parameters
+    antEast = gCSVp(row, 'antEast')
+    antNorth = gCSVp(row, 'antNorth')
+    antHeightAG = gCSVp(row, 'antHeightAG')
+    radius = gCSVp(row, 'radius')
+    freq = gCSVp(row, 'freq')
+    modelName = gCSVp(row, 'model')
+    secName = gCSVp(row, 'cellName') + '-' + gCSVp(row, 'antID')
+    pvals = param_vals(row)  # used for both the model and the sector (MaxPower) part
+
+    # ---- model
+    modelFilename = ('_' + modelName + ''.join('_' + pval for pval in pvals) + '_' +
+                     antEast + '_' + antNorth + '_' + antHeightAG + '_' + 
+                     radius + '_' + freq)
+    if not modelFilename in requiredModSecFilesSet:
         requiredModSecFilesList.append(modelFilename)
-    if  modelFilename not in modelFilenameList:
+        requiredModSecFilesSet.add(modelFilename)
+    if  modelFilename not in modelFilenameSet:
         # check for file existence
-        if fRecalc or not modelFilename in existingFilesList:
+        if fRecalc or not modelFilename in existingFilesSet:
             # file does not exist yet (or recalculation of all files required), proceed
             modelFilenameList.append(modelFilename)
+            modelFilenameSet.add(modelFilename)
+            # options common to all the models
+            antParts = [('coordinate', antEast + ',' + antNorth), ('ant_height', antHeightAG), ('radius', radius)]
 
             # model hata (GRASS command r.hata)
             if modelName == 'hata':
-                modelCmd = ('r.hata input_dem=' + demFilename + ' output=' + modelFilename +
-                            ' area_type=' + gCSVp('P1') + 
-                            ' coordinate=' + gCSVp('antEast') + ',' + gCSVp('antNorth') +
-                            ' ant_height=' + gCSVp('antHeightAG') + ' radius=' + gCSVp('radius') +
-                            ' rx_ant_height=' + rxAntHeightStr +
-                            ' frequency=' + gCSVp('freq') + ' --overwrite')
+                modelCmd = grass_cmd('r.hata', [('input_dem', demFilename), ('output', modelFilename),
+                                                ('area_type', gCSVp(row, 'P1'))] +
+                                     antParts + [('rx_ant_height', rxAntHeightStr), ('frequency', freq)])
 
             # model hataDEM (GRASS command r.hataDEM)
             elif modelName == 'hataDEM':
                 if cmFilename == '':
                     grass.fatal('HataDEM model requires a clutter map to be specified')
-                modelCmd = ('r.hataDEM input_dem=' + demFilename + ' clutter=' + cmFilename + ' output=' + modelFilename +
-                            ' a0=' + gCSVp('P1') + ' a1=' + gCSVp('P2') + ' a2=' + gCSVp('P3') + ' a3=' + gCSVp('P4') + 
-                            ' coordinate=' + gCSVp('antEast') + ',' + gCSVp('antNorth') +
-                            ' ant_height=' + gCSVp('antHeightAG') + ' radius=' + gCSVp('radius') +
-                            ' rx_ant_height=' + rxAntHeightStr +
-                            ' frequency=' + gCSVp('freq') + ' --overwrite')
+                modelCmd = grass_cmd('r.hataDEM', [('input_dem', demFilename), ('clutter', cmFilename),
+                                                   ('output', modelFilename),
+                                                   ('a0', gCSVp(row, 'P1')), ('a1', gCSVp(row, 'P2')),
+                                                   ('a2', gCSVp(row, 'P3')), ('a3', gCSVp(row, 'P4'))] +
+                                     antParts + [('rx_ant_height', rxAntHeightStr), ('frequency', freq)])
 
             # model cost231 (GRASS command r.cost231)
             elif modelName == 'cost231':
-                modelCmd = ('r.cost231 input_dem=' + demFilename + ' output=' + modelFilename +
-                            ' area_type=' + gCSVp('P1') + 
-                            ' coordinate=' + gCSVp('antEast') + ',' + gCSVp('antNorth') +
-                            ' ant_height=' + gCSVp('antHeightAG') + ' radius=' + gCSVp('radius') +
-                            ' frequency=' + gCSVp('freq') + ' --overwrite')
+                modelCmd = grass_cmd('r.cost231', [('input_dem', demFilename), ('output', modelFilename),
+                                                   ('area_type', gCSVp(row, 'P1'))] +
+                                     antParts + [('frequency', freq)])
 
             # model Walfisch-Ikegami (GRASS command r.waik)
             elif modelName == 'waik':
-                modelCmd = ('r.waik input_dem=' + demFilename + ' output=' + modelFilename +
-                            ' free_space_loss_correction=' + gCSVp('P1') + ' bs_correction=' + gCSVp('P2') + 
-                            ' range_correction=' + gCSVp('P3') + ' street_width_correction=' + gCSVp('P4') + 
-                            ' frequency_correction=' + gCSVp('P5') + ' building_height_correction=' + gCSVp('P6') + 
-                            ' street_width=' + gCSVp('P7') + ' distance_between_buildings=' + gCSVp('P8') + 
-                            ' building_height=' + gCSVp('P9') + ' phi_street=' + gCSVp('P10') + 
-                            ' area_type=' + gCSVp('P11') +
-                            ' coordinate=' + gCSVp('antEast') + ',' + gCSVp('antNorth') +
-                            ' ant_height=' + gCSVp('antHeightAG') + ' radius=' + gCSVp('radius') +
-                            ' frequency=' + gCSVp('freq') + ' --overwrite')
+                modelCmd = grass_cmd('r.waik', [('input_dem', demFilename), ('output', modelFilename),
+                                                ('free_space_loss_correction', gCSVp(row, 'P1')),
+                                                ('bs_correction', gCSVp(row, 'P2')),
+                                                ('range_correction', gCSVp(row, 'P3')),
+                                                ('street_width_correction', gCSVp(row, 'P4')),
+                                                ('frequency_correction', gCSVp(row, 'P5')),
+                                                ('building_height_correction', gCSVp(row, 'P6')),
+                                                ('street_width', gCSVp(row, 'P7')),
+                                                ('distance_between_buildings', gCSVp(row, 'P8')),
+                                                ('building_height', gCSVp(row, 'P9')),
+                                                ('phi_street', gCSVp(row, 'P10')),
+                                                ('area_type', gCSVp(row, 'P11'))] +
+                                     antParts + [('frequency', freq)])
 
             # model fspl (GRASS command r.fspl)
             elif modelName == 'fspl':
-                modelCmd = ('r.fspl input_dem=' + demFilename + ' output=' + modelFilename +
-                            ' loss_exp=' + gCSVp('P1') + ' loss_offset=' + gCSVp('P2') + 
-                            ' coordinate=' + gCSVp('antEast') + ',' + gCSVp('antNorth') +
-                            ' ant_height=' + gCSVp('antHeightAG') + ' radius=' + gCSVp('radius') +
-                            ' rx_ant_height=' + rxAntHeightStr +
-                            ' frequency=' + gCSVp('freq') + ' --overwrite')
+                modelCmd = grass_cmd('r.fspl', [('input_dem', demFilename), ('output', modelFilename),
+                                                ('loss_exp', gCSVp(row, 'P1')), ('loss_offset', gCSVp(row, 'P2'))] +
+                                     antParts + [('rx_ant_height', rxAntHeightStr), ('frequency', freq)])
 
 #            # model itm (GRASS command r.itm)
 #            elif modelName == 'itm':
-#                modelCmd = ('r.itm input_dem=' + demFilename + ' output=' + modelFilename +
-#                            ' relperm=' + gCSVp('P1') + ' conductivity=' + gCSVp('P2') + ' surfref=' + gCSVp('P3') + 
-#                            ' radclimate=' + gCSVp('P4') + ' polarization=' + gCSVp('P5') + ' situations=' + gCSVp('P6') + 
-#                            ' time=' + gCSVp('P7') + 
-#                            ' coordinate=' + gCSVp('antEast') + ',' + gCSVp('antNorth') +
-#                            ' ant_height=' + gCSVp('antHeightAG') + ' radius=' + gCSVp('radius') +
-#                            ' frequency=' + gCSVp('freq') + ' --overwrite')
+#                modelCmd = grass_cmd('r.itm', [('input_dem', demFilename), ('output', modelFilename),
+#                                               ('relperm', gCSVp(row, 'P1')), ('conductivity', gCSVp(row, 'P2')),
+#                                               ('surfref', gCSVp(row, 'P3')), ('radclimate', gCSVp(row, 'P4')),
+#                                               ('polarization', gCSVp(row, 'P5')), ('situations', gCSVp(row, 'P6')),
+#                                               ('time', gCSVp(row, 'P7'))] +
+#                                     antParts + [('frequency', freq)])
 
 #            # model urban (GRASS command r.urban)
 #            elif modelName == 'urban':
@@ -1338,72 +1415,61 @@ for row in cellTable:
 #                    grass.fatal('Urban model requires a clutter map to be specified')
 #                if bmFilename == '':
 #                    grass.fatal('Urban model requires a buildings map to be specified')
-#                modelCmd = ('r.urban input_dem=' + demFilename + ' clutter=' + cmFilename + ' buildings=' + bmFilename +
-#                            ' output=' + modelFilename +
-#                            ' models_to_use=' + gCSVp('P1') + ' screen_separation=' + gCSVp('P2') +
-#                            ' coordinate=' + gCSVp('antEast') + ',' + gCSVp('antNorth') +
-#                            ' ant_height=' + gCSVp('antHeightAG') + ' radius=' + gCSVp('radius') +
-#                            ' frequency=' + gCSVp('freq') + ' --overwrite')
+#                modelCmd = grass_cmd('r.urban', [('input_dem', demFilename), ('clutter', cmFilename),
+#                                                 ('buildings', bmFilename), ('output', modelFilename),
+#                                                 ('models_to_use', gCSVp(row, 'P1')),
+#                                                 ('screen_separation', gCSVp(row, 'P2'))] +
+#                                     antParts + [('frequency', freq)])
 
 #            # model ITUR1546-4 (GRASS command r.ITUR1546-4)
 #            elif modelName == 'ITUR1546-4':
-#                modelCmd = ('r.ITUR1546-4 input_dem=' + demFilename +
-#                            ' output=' + modelFilename +
-#                            ' area_type=' + gCSVp('P1') + ' time_percentage=' + gCSVp('P2') +
-#                            ' coordinate=' + gCSVp('antEast') + ',' + gCSVp('antNorth') +
-#                            ' ant_height=' + gCSVp('antHeightAG') + ' radius=' + gCSVp('radius') +
-#                            ' rx_ant_height=' + rxAntHeightStr +
-#                            ' frequency=' + gCSVp('freq') + ' --overwrite')
+#                modelCmd = grass_cmd('r.ITUR1546-4', [('input_dem', demFilename), ('output', modelFilename),
+#                                                      ('area_type', gCSVp(row, 'P1')),
+#                                                      ('time_percentage', gCSVp(row, 'P2'))] +
+#                                     antParts + [('rx_ant_height', rxAntHeightStr), ('frequency', freq)])
 
             else:
                 print('??? INTERNAL ERROR - unknown model (=', modelName, ')')
 
-            modelCmdList.append([modelCmd, gCSVp('cellName') + '-' + gCSVp('antID')])
-
-
-# ---- PREPARE GRASS_GIS SECTOR PROCESSING ----
+            modelCmdList.append([modelCmd, secName])
 
-sectorFilenameList=[]
-sectorCmdList=[]
-maxPowerSecList=[]
-
-for row in cellTable:
-    gCSVp = init_getCSVparam(refCellTableHeader, row)
-    modelName = gCSVp('model')
-    modelFilename = ('_' + modelName + param_vals_str('_') + '_' +
-                     gCSVp('antEast') + '_' + gCSVp('antNorth') + '_' + gCSVp('antHeightAG') + '_' + 
-                     gCSVp('radius') + '_' + gCSVp('freq'))
-    sectorFilename = (gCSVp('cellName').replace('_','') + '-' + gCSVp('antID') +
-                      modelFilename + '_' + gCSVp('antDirection') + '_' + gCSVp('antElecTilt') + '_' +
-                      gCSVp('antMechTilt') + '_' + gCSVp('antType'))
+    # ---- sector
+    sectorFilename = (gCSVp(row, 'cellName').replace('_','') + '-' + gCSVp(row, 'antID') +
+                      modelFilename + '_' + gCSVp(row, 'antDirection') + '_' + gCSVp(row, 'antElecTilt') + '_' +
+                      gCSVp(row, 'antMechTilt') + '_' + gCSVp(row, 'antType'))
     requiredModSecFilesList.append(sectorFilename)
-    if sectorFilename in sectorFilenameList:
+    requiredModSecFilesSet.add(sectorFilename)
+    if sectorFilename in sectorFilenameSet:
         print('??? INTERNAL ERROR - duplicated sector in input table (should have been reported)')
         sys.exit(1)
     # prepare data for MaxPower
-    maxPowerSec = (gCSVp('cellName') + ';' + gCSVp('antID') + ';' + sectorFilename + '@' + mapset + ';' +
-                   gCSVp('power') + ';' + modelName + param_vals_str(';'))
+    maxPowerSec = (gCSVp(row, 'cellName') + ';' + gCSVp(row, 'antID') + ';' + sectorFilename + '@' + mapset + ';' +
+                   gCSVp(row, 'power') + ';' + modelName + ''.join(';' + pval for pval in pvals))
     maxPowerSecList.append(maxPowerSec) 
     # check for file existence
-    if fRecalc or not sectorFilename in existingFilesList:
+    if fRecalc or not sectorFilename in existingFilesSet:
         # file does not exist yet (or recalculation of all files required), proceed
-        antennas = findAntennas( antMapTable, gCSVp('antType'), float( gCSVp('freq')), float(gCSVp('antElecTilt')))
+        antKey = (gCSVp(row, 'antType'), float( freq), float(gCSVp(row, 'antElecTilt')))
+        antennas = _antCache.get(antKey)
+        if antennas is None:
+            antennas = _antCache[antKey] = findAntennas( _antIndex, *antKey)
         if len(antennas) == 0:
-            grass.fatal('No suitable antenna found (type=' + gCSVp('antType') +
-                        ' freq=' + gCSVp('freq') + ' etilt=' + gCSVp('antElecTilt') + ')')
+            grass.fatal('No suitable antenna found (type=' + gCSVp(row, 'antType') +
+                        ' freq=' + freq + ' etilt=' + gCSVp(row, 'antElecTilt') + ')')
 ##        if len(antennas) > 1:
 ##            grass.info('Multiple suitable antennas found, the first one will be used:\n' + str(antennas))
         antMSIpath = amDict[antennas[0]];
         sectorFilenameList.append(sectorFilename)
-        sectorCmd = ('r.sector pathloss_raster=' + modelFilename + '@' + mapset +
-                     ' input_dem=' + demFilename + ' output=' + sectorFilename +
-                     ' east=' + gCSVp('antEast') + ' north=' + gCSVp('antNorth') +
-                     ' radius=' + gCSVp('radius') +
-                     ' ant_data_file=' + antMSIpath + ' beam_direction=' + gCSVp('antDirection') +
-                     ' mech_tilt=' + gCSVp('antMechTilt') + ' height_agl=' + gCSVp('antHeightAG') +
-                     ' rx_ant_height=' + rxAntHeightStr + ' --overwrite')
+        sectorFilenameSet.add(sectorFilename)
+        sectorCmd = grass_cmd('r.sector', [('pathloss_raster', modelFilename + '@' + mapset),
+                                           ('input_dem', demFilename), ('output', sectorFilename),
+                                           ('east', antEast), ('north', antNorth), ('radius', radius),
+                                           ('ant_data_file', antMSIpath),
+                                           ('beam_direction', gCSVp(row, 'antDirection')),
+                                           ('mech_tilt', gCSVp(row, 'antMechTilt')), ('height_agl', antHeightAG),
+                                           ('rx_ant_height', rxAntHeightStr)])
 
-        sectorCmdList.append([sectorCmd, gCSVp('cellName') + '-' + gCSVp('antID')])
+        sectorCmdList.append([sectorCmd, secName])
 
 
 # ---- DELETE EXISTING FILES NOT REQUIRED BY THIS SIMULATION RUN (for all defined channel models) ----
@@ -1426,94 +1492,168 @@ if fPurge:
     # files will be deleted if not needed in this simulation run
     ndel = 0
     delFileList = []
+    # optional label (up to the first '_'), then '_<model>_'
+    modelPrefixRe = re.compile('[^_]*_(?:' + '|'.join(map(re.escape, modelList)) + ')_')
     for fname in existingFilesList:
-        fnameNolabel = fname[fname.find('_'):]  # skip 'label0' - find first '_' and check from there on
-        for model in modelList:
-            if fname.startswith('_' + model + '_') or fnameNolabel.startswith('_' + model + '_'):
-                if not fname in requiredModSecFilesList:
-                    delFileList.append(fname)
-                    ndel += 1
-                break
+        if modelPrefixRe.match(fname):
+            if not fname in requiredModSecFilesSet:
+                delFileList.append(fname)
+                ndel += 1
     if ndel == 0:
         grass.info('Purge: no files deleted')
     else:
         _msgstr = 'Purge: the following file are not needed by this run and will be deleted:\n'
-        for fname in delFileList:
-            _msgstr += fname + '\n'
+        _msgstr += ''.join(fname + '\n' for fname in delFileList)
 ##        grass.info(_msgstr)
         print(_msgstr)  # grass_info() can not handle very large strings, script crashes
 
-        for fname in delFileList:
-            grass.run_command("g.remove",rast=fname)
+        # one g.remove call per batch of files (instead of per file)
+        removeChunkLen = 500  # max number of files per g.remove call (command line length limit)
+        for ix in range(0, len(delFileList), removeChunkLen):
+            grass.run_command("g.remove", flags='f', type='raster', name=delFileList[ix:ix+removeChunkLen])
 
 
 
 # ---- COMMANDS EXECUTION (MODEL, SECTOR) ----
 
+
+import shutil
+
+_cmdPaths = {}  # command name -> full pathname
+
+def cmd_path(cmdName):
+    """
+    Full pathname of a command (searched in PATH only once per command)
+    """
+    path = _cmdPaths.get(cmdName)
+    if path is None:
+        path = _cmdPaths[cmdName] = shutil.which(cmdName) or cmdName
+    return path
+
+
+import threading
+
+def drain_pipe(pipe, buf):
+    """
+    Read a subprocess pipe into buf (bytearray) until EOF, so the subprocess never blocks on a full pipe
+    """
+    with pipe:
+        buf += pipe.read()
+
+
+def wait_child(spPids, idleWaits=0):
+    """
+    Wait (block) until any child process has finished, returns its pid if it is one of spPids
+    (None otherwise); the child is not reaped, so that its Popen.poll() still gets the return code
+    (idleWaits: number of previous waits with no subprocess finished, for the sleep back-off)
+    """
+    if hasattr(os, 'waitid'):
+        try:
+            pid = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT).si_pid
+            if pid in spPids:
+                return pid
+            # a finished child process not started by us (and not reaped by its owner yet):
+            # waitid() would return it again at once - sleep instead (no busy loop)
+        except ChildProcessError:
+            pass
+    # waitid not available (or no child process, or not our child) - just sleep a bit,
+    # from 1 ms up to 50 ms, longer while nothing finishes
+    time.sleep(min(0.050, 0.001 * (1 + idleWaits // 5)))
+    return None
+
+
+def stop_subprocesses(spDict):
+    """
+    Terminate (or kill, if needed) the subprocesses still running and clear the subprocess list
+    (their output is not reported; a pipe can stay open after the subprocess has ended, if inherited
+    by a process it started, so the (daemon) reader threads are waited for only briefly)
+    """
+    for [sp, ixold, drainThreads, outBufs] in spDict.values():
+        sp.terminate()
+    for [sp, ixold, drainThreads, outBufs] in spDict.values():
+        try:
+            sp.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            sp.kill()
+            sp.wait()
+        for thread in drainThreads:
+            thread.join(timeout=1)
+    spDict.clear()
+
+
+__spList = {}  # running subprocesses of grass_parcmds() (pid -> subprocess data)
+
 def grass_parcmds( cmd_a, ix, spMax):
     """
     Parallel execution of grass command execution (speedup for multicore processors)
     """ 
-    global __spList  # subprocess list - local use but it should persist between procedure invocations
-
-    # check if __spList exists, otherwise create it (first calling)
-    try:
-        __spList
-    except NameError:
-        __spList = []
-
-    # loop slowly until:
+    # loop until:
     #  - a new subprocess can be started (limited by max number of subprocesses - spMax)
     #  - and the number of running subprocesses falls (again) below spMAX (usually spMax-1 on exit)
+    pidsToCheck = []  # nothing to check on entry - finished subprocesses are reported by wait_child()
+    idleWaits = 0
     while True:
         # check for finished subprocesses, delete them from the subprocess list (__spList)
-        for ixsp, [sp, ixold] in enumerate(__spList):
+        for pid in pidsToCheck:
+            [sp, ixold, drainThreads, outBufs] = __spList[pid]
             iret = sp.poll()
             if iret != None:
                 # a subprocess has finished
+                idleWaits = 0
                 grass.info('< (' + str(ixold+1) + './_)')
 
                  # print stdout and stderr
-                (stdoutdata, stderrdata) = sp.communicate()
-                # remove "%" progress substrings (like '  29%<BS><BS><BS><BS><BS>')
-                # test example: re.sub( '\ [\ 0-9]{3,3}%\b{5,5}', '', '  29%\b\b\b\b\b')
-                stdoutdata = re.sub( b'\ [\ 0-9]{3,3}%[\b]{5,5}', b'', stdoutdata)
-                stderrdata = re.sub( b'\ [\ 0-9]{3,3}%[\b]{5,5}', b'', stderrdata)
-                # remove final '\n'(s) if any
-                stdoutdata = re.sub( b'\n*\Z', b'', stdoutdata)
-                stderrdata = re.sub( b'\n*\Z', b'', stderrdata)
+                for thread in drainThreads:
+                    thread.join()
+                (stdoutdata, stderrdata) = (bytes(outBufs[0]), bytes(outBufs[1]))
+                # remove "%" progress substrings and final '\n'(s) if any
+                stdoutdata = _PROGRESS_RE.sub( b'', stdoutdata).rstrip(b'\n')
+                stderrdata = _PROGRESS_RE.sub( b'', stderrdata).rstrip(b'\n')
                 if len(stdoutdata) > 0:
-                    grass.info('(O)' + stdoutdata)
+                    grass.info('(O)' + stdoutdata.decode(errors='replace'))
                 if len(stderrdata) > 0:
-                    grass.info('(E)' + stderrdata)
+                    grass.info('(E)' + stderrdata.decode(errors='replace'))
 
                 if iret != 0:
-                    # there was an error -> no further processing, just return
+                    # there was an error -> no further processing, stop the other subprocesses and return
+                    stop_subprocesses(__spList)
                     return iret
                 # subprocess finished successfully - clean up and proceed
-                __spList.pop(ixsp)
+                del __spList[pid]
 
-        # if no room available for a new process-> sleep a bit
+        # if no room available for a new process-> wait for a subprocess to finish
         # if room available for a new process -> start it and clear cmd_a
         # if no process to start (cmd_a == []) -> return
         if len(__spList) < spMax:
             if cmd_a != []:
-               sp = subprocess.Popen(cmd_a, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-               __spList.append([sp,ix])
+               # a full executable pathname and close_fds=False let subprocess use posix_spawn() instead
+               # of fork()+exec() (no page table copy of this process); no fds leak, since all the files
+               # and pipes Python opens are non-inheritable (PEP 446)
+               sp = subprocess.Popen(cmd_a, executable=cmd_path(cmd_a[0]), close_fds=False,
+                                     stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+               # read stdout and stderr while the subprocess runs (see drain_pipe())
+               outBufs = (bytearray(), bytearray())
+               drainThreads = [threading.Thread(target=drain_pipe, args=(pipe, buf), daemon=True)
+                               for (pipe, buf) in zip((sp.stdout, sp.stderr), outBufs)]
+               for thread in drainThreads:
+                   thread.start()
+               __spList[sp.pid] = [sp, ix, drainThreads, outBufs]
                cmd_a = []
             else: return 0
-        else: time.sleep(0.010)
+        else:
+            pid = wait_child(__spList, idleWaits)
+            idleWaits += 1
+            # check the finished subprocess only (all of them if not known)
+            pidsToCheck = [pid] if pid in __spList else list(__spList)
 
 
 def exec_cmds(cmdList, parMax):
     """
     Processes commands from commnad list, returns False in case of an error, True otherwise
     """ 
-    for ix, [cmd, secName] in enumerate(cmdList):
-        grass.info('> ' + secName + ' (' + str(ix+1) + './' + str(len(cmdList)) + ')\n' + cmd)
-        # evaluate GISBASE enviroment variable
-        cmd_eval = cmd.replace('$GISBASE',os.getenv('GISBASE'))
-        cmd_a = cmd_eval.split()
+    # (commands are ready to run - environment variables (e.g. $GISBASE) are evaluated when they are built)
+    for ix, [cmd_a, secName] in enumerate(cmdList):
+        grass.info('> ' + secName + ' (' + str(ix+1) + './' + str(len(cmdList)) + ')\n' + ' '.join(cmd_a))
         if parMax == 0:
             # non-parallel execution
             iret = subprocess.call(cmd_a)
@@ -1552,8 +1692,7 @@ if modelCmdList != []:
             grass.fatal("Error(s) while processing 'model' commands, exiting")
     else:
         grassMsg = 'This is a test run only, the following model commands would be executed:\n'
-        for row in modelCmdList:
-           grassMsg += row[0] + '\n'
+        grassMsg += ''.join(' '.join(row[0]) + '\n' for row in modelCmdList)
 ########        grass.info(grassMsg)
         print(grassMsg)  ######## grass.info() seems to fail for large messages (nothing printed)
     timeModels1 = time.time()
@@ -1572,8 +1711,7 @@ if sectorCmdList != []:
             grass.fatal("Error(s) while processing 'sector' commands, exiting")
     else:
         grassMsg = 'This is a test run only, the following model commands would be executed:\n'
-        for row in sectorCmdList:
-           grassMsg += row[0] + '\n'
+        grassMsg += ''.join(' '.join(row[0]) + '\n' for row in sectorCmdList)
 ########        grass.info(grassMsg)
         print(grassMsg)  ######## grass.info() seems to fail for large messages (nothing printed)
     timeSectors1 = time.time()
@@ -1592,12 +1730,12 @@ else:
 
     import tempfile
 
-    strOverwrite = ''
+    overwriteArgs = []
 ##     if grass.gisenv()['OVERWRITE'] == '1': ## supposed to work according to the manual, but it does not
-##        strOverwrite = ' --overwrite'
+##        overwriteArgs = ['--overwrite']
     if "GRASS_OVERWRITE" in os.environ:
         if os.environ["GRASS_OVERWRITE"] == '1':
-            strOverwrite = ' --overwrite'
+            overwriteArgs = ['--overwrite']
 
     cellNum = options['cellnum']
 
@@ -1610,8 +1748,7 @@ else:
 
     # Create intermediate (temporary) radio cell/sector table file
     tmpFile = tempfile.NamedTemporaryFile()
-    for row in maxPowerSecList:
-        tmpFile.write( bytes( row + '\n', 'ascii'))
+    tmpFile.write( ('\n'.join(maxPowerSecList) + '\n').encode('ascii'))
     tmpFile.flush()
     
 
@@ -1622,27 +1759,25 @@ else:
     else:
         dbperfStr = '1';
 
-    mpcmd = ("r.MaxPower 'cell_input=" + tmpFile.name + "' output=" + outFilename + 
-             ' generate=' + options['generate'] + ' bandwidth=' + options['bandwidth'] +
-             ' table=' + dbFilename + ' driver=' + dbDriverName + " 'database=" + databaseName + "' dbperf=" + dbperfStr +
-             ' cell_num=' + str(cellNum) + strOverwrite)
+    # (argument list - no shell involved, no quoting needed)
+    mpcmd_a = (['r.MaxPower', 'cell_input=' + tmpFile.name, 'output=' + outFilename,
+                'generate=' + options['generate'], 'bandwidth=' + options['bandwidth'],
+                'table=' + dbFilename, 'driver=' + dbDriverName, 'database=' + databaseName, 'dbperf=' + dbperfStr,
+                'cell_num=' + str(cellNum)] + overwriteArgs)
 
     rxThresholdStr = options['rx_threshold']
     if rxThresholdStr != '':
-      mpcmd += (' rx_threshold=' + str( rxThresholdStr))
+      mpcmd_a.append('rx_threshold=' + str( rxThresholdStr))
 
 
     if dbDriverName == 'none':
-        grass.info('> WRITE RASTER MAP ONLY\n' + mpcmd)
+        grass.info('> WRITE RASTER MAP ONLY\n' + ' '.join(mpcmd_a))
     else:
-        grass.info('> WRITE RASTER MAP AND DATA TABLE\n' + mpcmd)
+        grass.info('> WRITE RASTER MAP AND DATA TABLE\n' + ' '.join(mpcmd_a))
     timeWriteDB0 = time.time()
     if fCheck:
         grass.info('This is a test run only, the above r.MaxPower command will not be executed')
     else:
-        mpcmd_a = mpcmd.split()
-        for ix, param in enumerate(mpcmd_a):
-            mpcmd_a[ix] = mpcmd_a[ix].strip("'")
         iret = subprocess.call(mpcmd_a)
         if iret != 0:
             grass.fatal('Error while creating final output files (DB and raster), exiting')
@@ -1656,10 +1791,7 @@ else:
     # Debugging: display the temporary file
     if fCheck:
         grassMsg = 'A temporary file (' + tmpFile.name + ') has been created for r.MaxPower with the following contents:\n'
-        tmpFile.seek(0)
-        for row in tmpFile:
-            grassMsg += row
-##        tmpFile.seek(0)
+        grassMsg += '\n'.join(maxPowerSecList) + '\n'  # the file contents (kept in memory)
 ########        grass.info(grassMsg)
         print(grassMsg)  ######## grass.info() seems to fail for large messages (nothing printed)
 
@@ -1689,14 +1821,11 @@ if maxPowerSecList != []:
 if flags['x']:
     grass.info('Writing xyz files...')
     mapNameList = modelFilenameList + sectorFilenameList + [outFilename]
-    for mapName in mapNameList:
-        fileName = mapName + '.xyz'
-        grass.info( ' > ' + fileName)
-        cmd = 'r.out.xyz input=' + mapName + ' output=' + fileName
-        cmd_a = cmd.split()
-        iret = subprocess.call(cmd_a)
-        if iret != 0:
-            grass.fatal('Error while creating xyz files, exiting')
+    # the exports are independent - run them (in parallel) as the model and sector commands
+    xyzCmdList = [[['r.out.xyz', 'input=' + mapName, 'output=' + mapName + '.xyz'], mapName + '.xyz']
+                  for mapName in mapNameList]
+    if not exec_cmds(xyzCmdList, parNum):
+        grass.fatal('Error while creating xyz files, exiting')
 
 
 